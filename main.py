@@ -1,8 +1,7 @@
 import pygame
 import numpy as np
 import cupy as cp
-from scipy.ndimage import label as scipy_label, distance_transform_edt
-import colorsys
+import cupyx
 import random
 
 # Initialize Pygame and create display
@@ -10,11 +9,15 @@ pygame.init()
 
 # Set grid dimensions first, then calculate screen size
 CELL_SIZE = 5
-GRID_WIDTH = 350  # This will create a 2560-pixel wide screen (512 * 5)
-GRID_HEIGHT = 350  # This will create a 1440-pixel high screen (288 * 5)
+GRID_WIDTH = 352  # Must be a multiple of 8 for the bit-packed tiles (352 * 5 = 1760 px)
+GRID_HEIGHT = 352  # Must be a multiple of 8 for the bit-packed tiles
 WIDTH = GRID_WIDTH * CELL_SIZE
 HEIGHT = GRID_HEIGHT * CELL_SIZE
 
+# The grid is stored bit-packed: each uint64 word holds an 8x8 tile of cells
+TILES_X = GRID_WIDTH // 8
+TILES_Y = GRID_HEIGHT // 8
+
 print(f"Grid dimensions: {GRID_WIDTH}x{GRID_HEIGHT}")
 print(f"Screen dimensions: {WIDTH}x{HEIGHT}")
 
@@ -22,14 +25,41 @@ screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.HWSURFACE | pygame.DOUB
 surface = pygame.Surface((WIDTH, HEIGHT))
 pygame.display.set_caption("The Game of Life")
 
-# Initialize empty grid with correct dimensions
-grid = cp.zeros((GRID_WIDTH, GRID_HEIGHT), dtype=cp.int32)
+# Initialize empty grid with correct dimensions (one uint64 word per 8x8 tile)
+grid = cp.zeros((TILES_Y, TILES_X), dtype=cp.uint64)
+
+# Add age tracking to the grid (kept unpacked, one entry per cell)
+cell_ages = cp.zeros((GRID_HEIGHT, GRID_WIDTH), dtype=cp.uint8)
+
+# Back buffers for the ping-pong update; the kernel overwrites every entry,
+# so the buffers are allocated once and swapped instead of zeroed and copied
+grid_back = cp.zeros((TILES_Y, TILES_X), dtype=cp.uint64)
+ages_back = cp.zeros((GRID_HEIGHT, GRID_WIDTH), dtype=cp.uint8)
 
-# Add age tracking to the grid
-cell_ages = cp.zeros((GRID_WIDTH, GRID_HEIGHT), dtype=cp.int32)
+# Compacted list of live-cell indices maintained by the update kernel; the
+# counter doubles as the global population count
+live_count = cp.zeros(1, dtype=cp.uint32)
+live_indices = cp.zeros(GRID_WIDTH * GRID_HEIGHT, dtype=cp.int32)
 
-# Add color tracking to the grid
-cell_colors = {}  # Dictionary to store colors for each cell
+# Streams for the frame pipeline: the update kernel runs on compute_stream
+# while copy_stream drains the previous state to the host for drawing.
+# compute_done marks the last kernel launch so copies and interactive writes
+# can order themselves against it.
+compute_stream = cp.cuda.Stream(non_blocking=True)
+copy_stream = cp.cuda.Stream(non_blocking=True)
+compute_done = cp.cuda.Event()
+compute_done.record()
+copy_done = cp.cuda.Event()
+copy_done.record()
+
+# Bit index of cell (row, col) within a tile is row * 8 + col
+BIT_WEIGHTS = cp.arange(64, dtype=cp.uint64)
+
+def unpack_cells(packed):
+    """Expand the bit-packed tile grid into a (height, width) 0/1 uint8 array"""
+    bits = (packed[:, :, None] >> BIT_WEIGHTS) & cp.uint64(1)
+    tiles = bits.reshape(TILES_Y, TILES_X, 8, 8).astype(cp.uint8)
+    return tiles.transpose(0, 2, 1, 3).reshape(GRID_HEIGHT, GRID_WIDTH)
 
 def screen_to_grid(pos):
     """Convert screen coordinates to grid coordinates"""
@@ -40,57 +70,139 @@ def screen_to_grid(pos):
         max(0, min(y, GRID_HEIGHT - 1))
     )
 
-def draw_at_position(grid_np, ages_np, pos):
-    """Draw live cells at the given position"""
+def draw_at_position(pos, total_population):
+    """Draw a live cell at the given position directly on the GPU grid"""
     x, y = screen_to_grid(pos)
-    if 0 <= x < GRID_WIDTH and 0 <= y < GRID_HEIGHT:
-        grid_np[x, y] = 1
-        ages_np[x, y] = 0  # Reset age for new cells
-    return grid_np, ages_np
+    mask = np.uint64(1) << np.uint64((y & 7) * 8 + (x & 7))
+    # Issue the writes on the compute stream: same-stream ordering queues them
+    # behind any in-flight update instead of stalling the host on an event
+    with compute_stream:
+        word = np.uint64(int(grid[y >> 3, x >> 3]))
+        if not word & mask:
+            grid[y >> 3, x >> 3] = word | mask
+            total_population += 1
+        cell_ages[y, x] = 0  # Reset age for new cells
+    compute_done.record(compute_stream)
+    return total_population
 
-# CUDA kernel with corrected indexing
+# CUDA kernel over bit-packed 8x8 tiles: each thread advances 64 cells at once,
+# summing the eight neighbors of every cell with a bitwise full-adder so the
+# whole tile is updated with ~20 word-wide ops instead of 64 * 8 integer loads
 update_kernel = cp.RawKernel(r'''
 extern "C" __global__
-void update_grid(const int* grid, int* new_grid, int* ages, int* new_ages, int width, int height) {
-    int x = blockDim.x * blockIdx.x + threadIdx.x;
-    int y = blockDim.y * blockIdx.y + threadIdx.y;
-    
-    if (x >= width || y >= height) return;
-    
-    int idx = y * width + x;
-    int total = 0;
-    
-    // Count live neighbors
-    for (int di = -1; di <= 1; di++) {
-        for (int dj = -1; dj <= 1; dj++) {
-            if (di == 0 && dj == 0) continue;
-            
-            int ni = (x + di + width) % width;
-            int nj = (y + dj + height) % height;
-            int nidx = nj * width + ni;
-            
-            total += grid[nidx];
-        }
+void update_grid(const unsigned long long* grid, unsigned long long* new_grid,
+                 const unsigned char* ages, unsigned char* new_ages,
+                 unsigned int* live_count, int* live_indices,
+                 int tiles_x, int tiles_y, int width, int height) {
+    int tx = blockDim.x * blockIdx.x + threadIdx.x;
+    int ty = blockDim.y * blockIdx.y + threadIdx.y;
+
+    // Stage the block's tiles plus a one-tile halo into shared memory, so
+    // each word is loaded from global memory once instead of up to 9 times.
+    // Threads stride over the halo area; the torus wrap uses the same
+    // branchless predicate adds as the rest of the kernels.
+    extern __shared__ unsigned long long tile[];
+    int halo_w = blockDim.x + 2;
+    int halo_h = blockDim.y + 2;
+    int gx0 = blockDim.x * blockIdx.x - 1;
+    int gy0 = blockDim.y * blockIdx.y - 1;
+    int nthreads = blockDim.x * blockDim.y;
+    for (int k = threadIdx.y * blockDim.x + threadIdx.x;
+         k < halo_w * halo_h; k += nthreads) {
+        int gx = gx0 + k % halo_w;
+        int gy = gy0 + k / halo_w;
+        gx += (gx < 0) * tiles_x - (gx >= tiles_x) * tiles_x;
+        gy += (gy < 0) * tiles_y - (gy >= tiles_y) * tiles_y;
+        tile[k] = grid[gy * tiles_x + gx];
     }
-    
-    // Apply Game of Life rules and update ages
-    if (grid[idx] == 1) {
-        if (total == 2 || total == 3) {
-            new_grid[idx] = 1;
-            new_ages[idx] = ages[idx] + 1;  // Increment age for surviving cells
-        } else {
-            new_grid[idx] = 0;
-            new_ages[idx] = 0;
+    __syncthreads();
+
+    if (tx < tiles_x && ty < tiles_y) {
+
+    // Center tile plus its eight neighbor tiles, read from the shared cache
+    int hx = threadIdx.x + 1;
+    int hy = threadIdx.y + 1;
+    unsigned long long c  = tile[hy * halo_w + hx];
+    unsigned long long n  = tile[(hy - 1) * halo_w + hx];
+    unsigned long long s  = tile[(hy + 1) * halo_w + hx];
+    unsigned long long w  = tile[hy * halo_w + hx - 1];
+    unsigned long long e  = tile[hy * halo_w + hx + 1];
+    unsigned long long nw = tile[(hy - 1) * halo_w + hx - 1];
+    unsigned long long ne = tile[(hy - 1) * halo_w + hx + 1];
+    unsigned long long sw = tile[(hy + 1) * halo_w + hx - 1];
+    unsigned long long se = tile[(hy + 1) * halo_w + hx + 1];
+
+    // Bit r*8+col is cell (row r, column col); each byte is one tile row
+    const unsigned long long COL_L = 0x0101010101010101ULL;  // column 0 of every row
+    const unsigned long long COL_R = 0x8080808080808080ULL;  // column 7 of every row
+
+    // Shift every tile so its bits line up with this tile's cells, giving one
+    // 64-bit plane per neighbor direction
+    unsigned long long up   = (c << 8) | (n >> 56);
+    unsigned long long down = (c >> 8) | (s << 56);
+    unsigned long long up_w = (w << 8) | (nw >> 56);
+    unsigned long long up_e = (e << 8) | (ne >> 56);
+    unsigned long long dn_w = (w >> 8) | (sw << 56);
+    unsigned long long dn_e = (e >> 8) | (se << 56);
+
+    unsigned long long lf = ((c << 1) & ~COL_L) | ((w & COL_R) >> 7);
+    unsigned long long rt = ((c >> 1) & ~COL_R) | ((e & COL_L) << 7);
+    unsigned long long ul = ((up << 1) & ~COL_L) | ((up_w & COL_R) >> 7);
+    unsigned long long ur = ((up >> 1) & ~COL_R) | ((up_e & COL_L) << 7);
+    unsigned long long dl = ((down << 1) & ~COL_L) | ((dn_w & COL_R) >> 7);
+    unsigned long long dr = ((down >> 1) & ~COL_R) | ((dn_e & COL_L) << 7);
+
+    // Carry-save adder tree: sum the eight planes into bitplanes n0..n3
+    unsigned long long a0 = up ^ down ^ lf;
+    unsigned long long a1 = (up & down) | (lf & (up ^ down));
+    unsigned long long b0 = rt ^ ul ^ ur;
+    unsigned long long b1 = (rt & ul) | (ur & (rt ^ ul));
+    unsigned long long c0 = dl ^ dr;
+    unsigned long long c1 = dl & dr;
+
+    unsigned long long n0 = a0 ^ b0 ^ c0;
+    unsigned long long t1 = (a0 & b0) | (c0 & (a0 ^ b0));
+    unsigned long long s1 = a1 ^ b1 ^ c1;
+    unsigned long long n1 = s1 ^ t1;
+    unsigned long long t2a = (a1 & b1) | (c1 & (a1 ^ b1));
+    unsigned long long t2b = s1 & t1;
+    unsigned long long n2 = t2a ^ t2b;
+    unsigned long long n3 = t2a & t2b;
+
+    // Alive next tick iff neighbors == 3, or == 2 and already alive
+    unsigned long long next = (~n3 & ~n2 & n1) & (n0 | c);
+
+    new_grid[ty * tiles_x + tx] = next;
+
+    // Compact this tile's live cells into the global index list; one slot
+    // reservation per live tile, and the counter is the population total
+    int base_x = tx * 8;
+    int base_y = ty * 8;
+    if (next) {
+        unsigned int pos = atomicAdd(live_count, (unsigned int)__popcll(next));
+        unsigned long long m = next;
+        while (m) {
+            int b = __ffsll(m) - 1;
+            m &= m - 1;
+            live_indices[pos++] = (base_y + (b >> 3)) * width + (base_x + (b & 7));
         }
-    } else {
-        if (total == 3) {
-            new_grid[idx] = 1;
-            new_ages[idx] = 0;  // New cells start with age 0
-        } else {
-            new_grid[idx] = 0;
-            new_ages[idx] = 0;
+    }
+
+    // Ages stay unpacked: survivors age by one, births and deaths reset to 0
+    for (int r = 0; r < 8; r++) {
+        for (int col = 0; col < 8; col++) {
+            int b = r * 8 + col;
+            int idx = (base_y + r) * width + (base_x + col);
+            if (((next >> b) & 1ULL) && ((c >> b) & 1ULL)) {
+                unsigned char a = ages[idx];
+                new_ages[idx] = a < 255 ? a + 1 : a;  // saturate so uint8 can't wrap
+            } else {
+                new_ages[idx] = 0;
+            }
         }
     }
+
+    }  // tile in range
 }
 ''', 'update_grid')
 
@@ -105,53 +217,111 @@ def create_density_gradient():
     return colors
 
 # Pre-calculate density gradient colors
-density_colors = create_density_gradient()
+DENSITY_COLORS = np.array(create_density_gradient(), dtype=np.uint8)
+
+# Population cap enforced when stamping, also the density-color scale (20% of grid)
+MAX_ALLOWED = int(GRID_WIDTH * GRID_HEIGHT * 0.20)
 
-def calculate_density_color(total_population, max_allowed):
+def calculate_density_color(total_population):
     """Calculate color based on population density"""
-    density_ratio = min(total_population / max_allowed, 1.0)
-    color_idx = int(density_ratio * 99)
-    return density_colors[color_idx]
-
-def draw_grid(grid_gpu, ages_gpu, surface):
-    grid = cp.asnumpy(grid_gpu)
-    ages = cp.asnumpy(ages_gpu)
-    surface.fill((0, 0, 0))  # Black background
-    
-    # Calculate current population and density
-    total_population = int(cp.sum(grid_gpu))
-    max_allowed = int(GRID_WIDTH * GRID_HEIGHT * 0.20)  # 20% of grid
-    base_color = calculate_density_color(total_population, max_allowed)
-    
-    rect = pygame.Rect(0, 0, CELL_SIZE - 1, CELL_SIZE - 1)
-    
-    # Draw all live cells
-    live_positions = np.where(grid == 1)
-    for x, y in zip(*live_positions):
-        rect.topleft = (x * CELL_SIZE, y * CELL_SIZE)
-        
-        if ages[x, y] < 3:  # New cells flash blue
-            # Fade from bright blue to the density-based grey
-            fade_ratio = ages[x, y] / 3
-            start_color = (100, 150, 255)  # Bright blue
-            
-            # Interpolate between blue and density-based grey
-            current_color = tuple(
-                int(start + (end - start) * fade_ratio)
-                for start, end in zip(start_color, base_color)
-            )
-        else:
-            current_color = base_color
-        
-        pygame.draw.rect(surface, current_color, rect)
-    
+    return DENSITY_COLORS[min(total_population * 99 // MAX_ALLOWED, 99)]
+
+# Pinned host staging buffers for the per-frame DtoH copies: allocating them
+# once avoids the pinned-allocation cost hidden inside cp.asnumpy, and pinned
+# memory lets the copies run asynchronously on the copy stream. Two sets are
+# kept so the frame being drawn is never the one still in flight.
+cells_ready = cupyx.zeros_pinned((GRID_HEIGHT, GRID_WIDTH), dtype=np.uint8)
+ages_ready = cupyx.zeros_pinned((GRID_HEIGHT, GRID_WIDTH), dtype=np.uint8)
+cells_pending = cupyx.zeros_pinned((GRID_HEIGHT, GRID_WIDTH), dtype=np.uint8)
+ages_pending = cupyx.zeros_pinned((GRID_HEIGHT, GRID_WIDTH), dtype=np.uint8)
+
+# Staging buffers for sparse frames, which copy only the compacted live-cell
+# list and the ages at those cells instead of the whole grid
+live_idx_ready = cupyx.zeros_pinned(GRID_WIDTH * GRID_HEIGHT, dtype=np.int32)
+live_ages_ready = cupyx.zeros_pinned(GRID_WIDTH * GRID_HEIGHT, dtype=np.uint8)
+live_idx_pending = cupyx.zeros_pinned(GRID_WIDTH * GRID_HEIGHT, dtype=np.int32)
+live_ages_pending = cupyx.zeros_pinned(GRID_WIDTH * GRID_HEIGHT, dtype=np.uint8)
+
+# Reusable pixel buffer for the vectorized renderer, viewed as
+# (grid_x, cell_px, grid_y, cell_px, rgb) so one broadcast fills every cell block
+pixel_buf = np.zeros((WIDTH, HEIGHT, 3), dtype=np.uint8)
+pixel_view = pixel_buf.reshape(GRID_WIDTH, CELL_SIZE, GRID_HEIGHT, CELL_SIZE, 3)
+
+# Pre-rendered cell sprites (one per fade age) for sparse frames, where a
+# batched blit per live cell is cheaper than the full-screen array pass
+cell_sprites = [pygame.Surface((CELL_SIZE - 1, CELL_SIZE - 1)) for _ in range(4)]
+SPARSE_THRESHOLD = GRID_WIDTH * GRID_HEIGHT // 50  # 2% of the grid
+
+def blue_fade_lut(base_color):
+    """Age-to-color table: new cells flash blue and fade to the density grey.
+
+    Rebuilt per frame because the grey endpoint follows the population density.
+    """
+    start_color = np.array((100, 150, 255), dtype=np.float32)
+    end_color = np.array(base_color, dtype=np.float32)
+    return (start_color + (end_color - start_color)
+            * np.array([0, 1 / 3, 2 / 3, 1])[:, None]).astype(np.uint8)
+
+def draw_grid(cells, ages, surface, total_population):
+    """Render a full frame from the unpacked cell and age arrays"""
+    fade_lut = blue_fade_lut(calculate_density_color(total_population))
+    colors = fade_lut[np.minimum(ages, 3)]
+    cell_rgb = np.where(cells[:, :, None] == 1, colors, 0)
+
+    # Upscale cell colors to screen pixels in one broadcast, transposed to
+    # the (x, y) layout surfarray expects, leaving a 1-px line between cells
+    pixel_view[:] = cell_rgb.transpose(1, 0, 2)[:, None, :, None, :]
+    pixel_view[:, CELL_SIZE - 1] = 0
+    pixel_view[:, :, :, CELL_SIZE - 1] = 0
+
+    pygame.surfarray.blit_array(surface, pixel_buf)
     screen.blit(surface, (0, 0))
     pygame.display.flip()
 
-# CUDA grid dimensions
-block_size = (16, 16)
-grid_size = ((GRID_WIDTH + block_size[0] - 1) // block_size[0],
-             (GRID_HEIGHT + block_size[1] - 1) // block_size[1])
+def draw_grid_sparse(live_idx, live_ages, surface, total_population):
+    """Render a frame from the compacted live-cell list (sparse frames only)"""
+    fade_lut = blue_fade_lut(calculate_density_color(total_population))
+
+    # Blit a pre-rendered sprite per live cell in one C-level batch, costing
+    # O(live cells) instead of O(screen pixels)
+    surface.fill((0, 0, 0))
+    for age, sprite in enumerate(cell_sprites):
+        sprite.fill(tuple(int(v) for v in fade_lut[age]))
+    ys, xs = np.divmod(live_idx, GRID_WIDTH)
+    cell_age = np.minimum(live_ages, 3)
+    surface.blits([(cell_sprites[age], (x * CELL_SIZE, y * CELL_SIZE))
+                   for age, x, y in zip(cell_age, xs, ys)], doreturn=False)
+
+    screen.blit(surface, (0, 0))
+    pygame.display.flip()
+
+def pick_block_size(kernel):
+    """Choose the kernel block shape from the occupancy API instead of a fixed 16x16"""
+    try:
+        _, max_threads = cp.cuda.driver.occupancyMaxPotentialBlockSize(
+            kernel.kernel.ptr, 0, 0, 0)
+    except Exception:
+        max_threads = kernel.attributes['max_threads_per_block']
+    sm_count = cp.cuda.Device().attributes['MultiProcessorCount']
+
+    # Factor the 1D occupancy result into (bx, by) with bx a full warp, then
+    # shrink the block while the launch leaves SMs with fewer than two blocks
+    bx = 32
+    by = max(max_threads // bx, 1)
+    while by > 1:
+        blocks = ((TILES_X + bx - 1) // bx) * ((TILES_Y + by - 1) // by)
+        if blocks >= 2 * sm_count:
+            break
+        by //= 2
+    return (bx, by)
+
+# CUDA grid dimensions (one thread per 8x8 tile)
+block_size = pick_block_size(update_kernel)
+grid_size = ((TILES_X + block_size[0] - 1) // block_size[0],
+             (TILES_Y + block_size[1] - 1) // block_size[1])
+
+# Dynamic shared memory for the kernel's halo tile cache (uint64 words)
+update_shared_mem = (block_size[0] + 2) * (block_size[1] + 2) * 8
 
 # Add pattern definitions
 PATTERNS = {
@@ -289,63 +459,127 @@ GALAGA_PATTERNS = {
     ]
 }
 
-def place_pattern(grid_np, ages_np, pattern_key, pos):
+def _mirrored(pattern):
+    """Mirror a pattern in both axes for symmetrical growth (used by the Breeder)"""
+    extended_pattern = []
+    for dx, dy in pattern:
+        extended_pattern.append((dx, dy))
+        extended_pattern.append((-dx - 1, dy))
+        extended_pattern.append((dx, -dy - 1))
+        extended_pattern.append((-dx - 1, -dy - 1))
+    return extended_pattern
+
+# Precompute every pattern as a device-resident offset array so stamping is a
+# single kernel launch with nothing uploaded per key press
+PATTERN_OFFSETS = {
+    key: cp.asarray(np.array(_mirrored(p) if key == '4' else p, dtype=np.int32))
+    for key, p in PATTERNS.items()
+}
+GALAGA_OFFSETS = {
+    key: cp.asarray(np.array(p, dtype=np.int32))
+    for key, p in GALAGA_PATTERNS.items()
+}
+
+# Tiny stamping kernels: count_new checks how many of a pattern's cells are
+# currently dead (for the population cap), stamp ORs the pattern into the
+# packed grid and resets the touched ages
+count_new_kernel = cp.RawKernel(r'''
+extern "C" __global__
+void count_new(const unsigned long long* grid, const int* offsets, int n,
+               int base_x, int base_y, int width, int height, int tiles_x,
+               unsigned int* new_cells) {
+    int i = blockDim.x * blockIdx.x + threadIdx.x;
+    if (i >= n) return;
+    int x = base_x + offsets[2 * i];
+    int y = base_y + offsets[2 * i + 1];
+    x += (x < 0) * width - (x >= width) * width;
+    y += (y < 0) * height - (y >= height) * height;
+    unsigned long long word = grid[(y >> 3) * tiles_x + (x >> 3)];
+    if (!((word >> ((y & 7) * 8 + (x & 7))) & 1ULL)) {
+        atomicAdd(new_cells, 1u);
+    }
+}
+''', 'count_new')
+
+stamp_kernel = cp.RawKernel(r'''
+extern "C" __global__
+void stamp(unsigned long long* grid, unsigned char* ages, const int* offsets, int n,
+           int base_x, int base_y, int width, int height, int tiles_x) {
+    int i = blockDim.x * blockIdx.x + threadIdx.x;
+    if (i >= n) return;
+    int x = base_x + offsets[2 * i];
+    int y = base_y + offsets[2 * i + 1];
+    x += (x < 0) * width - (x >= width) * width;
+    y += (y < 0) * height - (y >= height) * height;
+    atomicOr(&grid[(y >> 3) * tiles_x + (x >> 3)],
+             1ULL << ((y & 7) * 8 + (x & 7)));
+    ages[y * width + x] = 0;  // New cells start with age 0
+}
+''', 'stamp')
+
+stamp_count = cp.zeros(1, dtype=cp.uint32)
+
+def stamp_pattern(offsets_gpu, base_x, base_y, total_population):
+    """Stamp a set of cell offsets into the GPU grid, respecting the population cap"""
+    if total_population >= MAX_ALLOWED:
+        return total_population
+
+    n = len(offsets_gpu)
+    blocks = ((n + 127) // 128,)
+    threads = (128,)
+
+    # Issue everything on the compute stream so the stamp is ordered behind
+    # any in-flight update without a host-side sync; reading the counter
+    # synchronizes only this stream
+    with compute_stream:
+        stamp_count.fill(0)
+        count_new_kernel(blocks, threads,
+                         (grid, offsets_gpu, n, base_x, base_y,
+                          GRID_WIDTH, GRID_HEIGHT, TILES_X, stamp_count))
+        new_cells = int(stamp_count[0])
+
+        if total_population + new_cells <= MAX_ALLOWED:
+            stamp_kernel(blocks, threads,
+                         (grid, cell_ages, offsets_gpu, n, base_x, base_y,
+                          GRID_WIDTH, GRID_HEIGHT, TILES_X))
+            total_population += new_cells
+    compute_done.record(compute_stream)
+    return total_population
+
+def place_pattern(pattern_key, pos, total_population):
     """Place a predefined pattern at the given position"""
+    if pattern_key not in PATTERN_OFFSETS:
+        return total_population
+
     base_x, base_y = screen_to_grid(pos)
-    
-    if pattern_key not in PATTERNS:
-        return grid_np, ages_np
-        
-    # Check current population
-    current_population = np.sum(grid_np)
-    max_allowed = int(GRID_WIDTH * GRID_HEIGHT * 0.20)
-    
-    if current_population >= max_allowed:
-        return grid_np, ages_np
-    
-    pattern = PATTERNS[pattern_key]
-    
-    # Special handling for pattern 4 (Breeder)
+
+    # Pattern 4 (Breeder) is centered for symmetrical growth
     if pattern_key == '4':
-        # Center the pattern and rotate it for better viewing
         base_x = GRID_WIDTH // 2 - 20
         base_y = GRID_HEIGHT // 2 - 3
-        
-        # Create mirrored version for symmetrical growth
-        extended_pattern = []
-        for dx, dy in pattern:
-            extended_pattern.append((dx, dy))
-            extended_pattern.append((-dx - 1, dy))
-            extended_pattern.append((dx, -dy - 1))
-            extended_pattern.append((-dx - 1, -dy - 1))
-        pattern = extended_pattern
-    
-    # Count new cells
-    new_cells = 0
-    for dx, dy in pattern:
-        x = (base_x + dx) % GRID_WIDTH
-        y = (base_y + dy) % GRID_HEIGHT
-        if 0 <= x < GRID_WIDTH and 0 <= y < GRID_HEIGHT and grid_np[x, y] == 0:
-            new_cells += 1
-    
-    # Place pattern if within population limit
-    if current_population + new_cells <= max_allowed:
-        for dx, dy in pattern:
-            x = (base_x + dx) % GRID_WIDTH
-            y = (base_y + dy) % GRID_HEIGHT
-            if 0 <= x < GRID_WIDTH and 0 <= y < GRID_HEIGHT:
-                grid_np[x, y] = 1
-                ages_np[x, y] = 0  # New cells start with age 0
-    
-    return grid_np, ages_np
+
+    return stamp_pattern(PATTERN_OFFSETS[pattern_key], base_x, base_y, total_population)
 
 # Main game loop
 clock = pygame.time.Clock()
 running = True
 paused = True  # Start paused
 mouse_down = False
+total_population = 0
+pop_ready = 0
+stepped = False
+sim_steps_per_frame = 1  # generations per rendered frame, tuned with +/-
+live_valid = False  # live_indices matches grid only right after a kernel step
+ready_sparse = False
 
 while running:
+    # Pick up the population of the state the last kernel produced before
+    # this frame's launch resets the counter
+    if stepped:
+        compute_done.synchronize()
+        total_population = int(live_count[0])
+        stepped = False
+
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             running = False
@@ -353,62 +587,90 @@ while running:
             if event.key == pygame.K_SPACE:
                 paused = not paused
             elif event.key == pygame.K_r:
-                grid = cp.zeros((GRID_WIDTH, GRID_HEIGHT), dtype=cp.int32)
-                cell_ages = cp.zeros((GRID_WIDTH, GRID_HEIGHT), dtype=cp.int32)
-                cell_colors.clear()
+                with compute_stream:
+                    grid.fill(0)
+                    cell_ages.fill(0)
+                compute_done.record(compute_stream)
+                total_population = 0
+                live_valid = False
+            elif event.key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+                sim_steps_per_frame += 1
+            elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                sim_steps_per_frame = max(1, sim_steps_per_frame - 1)
             # Handle number keys for existing patterns
             elif event.unicode in '0123456789':
-                grid_np = cp.asnumpy(grid)
-                ages_np = cp.asnumpy(cell_ages)
-                grid_np, ages_np = place_pattern(grid_np, ages_np, event.unicode, pygame.mouse.get_pos())
-                grid = cp.array(grid_np)
-                cell_ages = cp.array(ages_np)
+                total_population = place_pattern(event.unicode, pygame.mouse.get_pos(), total_population)
+                live_valid = False
             # Handle Galaga patterns
-            elif event.unicode.lower() in GALAGA_PATTERNS:
-                grid_np = cp.asnumpy(grid)
-                ages_np = cp.asnumpy(cell_ages)
-                pattern = GALAGA_PATTERNS[event.unicode.lower()]
+            elif event.unicode.lower() in GALAGA_OFFSETS:
                 base_x, base_y = screen_to_grid(pygame.mouse.get_pos())
-                
-                # Check population limit
-                current_population = np.sum(grid_np)
-                max_allowed = int(GRID_WIDTH * GRID_HEIGHT * 0.20)
-                
-                if current_population < max_allowed:
-                    for dx, dy in pattern:
-                        x = (base_x + dx) % GRID_WIDTH
-                        y = (base_y + dy) % GRID_HEIGHT
-                        if 0 <= x < GRID_WIDTH and 0 <= y < GRID_HEIGHT:
-                            grid_np[x, y] = 1
-                            ages_np[x, y] = 0  # New cells start with age 0
-                
-                grid = cp.array(grid_np)
-                cell_ages = cp.array(ages_np)
+                total_population = stamp_pattern(GALAGA_OFFSETS[event.unicode.lower()],
+                                                 base_x, base_y, total_population)
+                live_valid = False
         elif event.type == pygame.MOUSEBUTTONDOWN:
             mouse_down = True
-            grid_np = cp.asnumpy(grid)
-            ages_np = cp.asnumpy(cell_ages)
-            grid_np, ages_np = draw_at_position(grid_np, ages_np, pygame.mouse.get_pos())
-            grid = cp.array(grid_np)
-            cell_ages = cp.array(ages_np)
+            total_population = draw_at_position(pygame.mouse.get_pos(), total_population)
+            live_valid = False
         elif event.type == pygame.MOUSEBUTTONUP:
             mouse_down = False
         elif event.type == pygame.MOUSEMOTION and mouse_down:
-            grid_np = cp.asnumpy(grid)
-            ages_np = cp.asnumpy(cell_ages)
-            grid_np, ages_np = draw_at_position(grid_np, ages_np, pygame.mouse.get_pos())
-            grid = cp.array(grid_np)
-            cell_ages = cp.array(ages_np)
+            total_population = draw_at_position(pygame.mouse.get_pos(), total_population)
+            live_valid = False
 
+    # Stage the current state on the copy stream once the kernel that produced
+    # it has finished; the CPU meanwhile keeps drawing the previous frame
+    copy_stream.wait_event(compute_done)
+    pending_sparse = live_valid and total_population < SPARSE_THRESHOLD
+    with copy_stream:
+        if pending_sparse:
+            # Sparse frame: stage only the compacted live list and its ages
+            if total_population:
+                idx_view = live_indices[:total_population]
+                idx_view.get(out=live_idx_pending[:total_population], stream=copy_stream)
+                cell_ages.ravel()[idx_view].get(
+                    out=live_ages_pending[:total_population], stream=copy_stream)
+        else:
+            unpack_cells(grid).get(out=cells_pending, stream=copy_stream)
+            cell_ages.get(out=ages_pending, stream=copy_stream)
+    copy_done.record(copy_stream)
+    pop_pending = total_population
+
+    # Run the next batch of generations; only the last one is rendered, so the
+    # GPU can burst ahead of the 60 Hz draw cadence with no extra transfers.
+    # The compute stream waits on the copy so later steps don't overwrite the
+    # buffer still draining to the host.
     if not paused:
-        new_grid = cp.zeros_like(grid)
-        new_ages = cp.zeros_like(cell_ages)
-        update_kernel(grid_size, block_size, (grid, new_grid, cell_ages, new_ages, GRID_WIDTH, GRID_HEIGHT))
-        grid = new_grid.copy()
-        cell_ages = new_ages.copy()
-    
-    draw_grid(grid, cell_ages, surface)
+        compute_stream.wait_event(copy_done)
+        with compute_stream:
+            for _ in range(sim_steps_per_frame):
+                live_count.fill(0)
+                update_kernel(grid_size, block_size,
+                              (grid, grid_back, cell_ages, ages_back,
+                               live_count, live_indices,
+                               TILES_X, TILES_Y, GRID_WIDTH, GRID_HEIGHT),
+                              shared_mem=update_shared_mem)
+                grid, grid_back = grid_back, grid
+                cell_ages, ages_back = ages_back, cell_ages
+        compute_done.record(compute_stream)
+        stepped = True
+        live_valid = True
+
+    if ready_sparse:
+        draw_grid_sparse(live_idx_ready[:pop_ready], live_ages_ready[:pop_ready],
+                         surface, pop_ready)
+    else:
+        draw_grid(cells_ready, ages_ready, surface, pop_ready)
+
+    # Retire the in-flight copy and rotate the host buffers for next frame
+    copy_stream.synchronize()
+    cells_ready, cells_pending = cells_pending, cells_ready
+    ages_ready, ages_pending = ages_pending, ages_ready
+    live_idx_ready, live_idx_pending = live_idx_pending, live_idx_ready
+    live_ages_ready, live_ages_pending = live_ages_pending, live_ages_ready
+    pop_ready = pop_pending
+    ready_sparse = pending_sparse
     clock.tick(60)
-    pygame.display.set_caption(f"Game of Life - FPS: {clock.get_fps():.1f}")
+    pygame.display.set_caption(
+        f"Game of Life - FPS: {clock.get_fps():.1f} - x{sim_steps_per_frame}")
 
 pygame.quit()